@@ -1,8 +1,12 @@
 import pygame
-import random
+from pygame import K_LEFT, K_RIGHT, K_a, K_d, K_SPACE, K_UP, K_w, K_r, K_q, KEYDOWN, KEYUP, QUIT
 import sys
+from functools import lru_cache
 import numpy as np
 
+# Bound once at import so the per-frame input check skips the module attribute lookups
+keystate = pygame.key.get_pressed
+
 # --- Constants ---
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -27,6 +31,7 @@ PLAYER_LIVES = 3
 BULLET_WIDTH = 5
 BULLET_HEIGHT = 15
 BULLET_SPEED = 6  # Reduced for slower bullets
+BULLET_POOL_SIZE = 20  # Bullets pre-allocated for reuse
 
 # Enemy properties
 ENEMY_COLS = 10
@@ -45,56 +50,90 @@ class SoundEngine:
     def __init__(self):
         self.sample_rate = 44100
         self.sounds = {}
+        # Shared float32 scratch space for waveform math, sized for 0.5 s of audio
+        # and grown by _buffers() if a longer sound is requested
+        max_samples = int(self.sample_rate * 0.5)
+        self._ramp = np.arange(max_samples, dtype=np.float32)
+        self._scratch = np.empty(max_samples, dtype=np.float32)
         self.generate_sounds()
 
+    def _buffers(self, samples):
+        """Return (ramp, scratch) views of length `samples`, growing the buffers if needed."""
+        if samples > self._scratch.shape[0]:
+            self._ramp = np.arange(samples, dtype=np.float32)
+            self._scratch = np.empty(samples, dtype=np.float32)
+        return self._ramp[:samples], self._scratch[:samples]
+
+    def _phase(self, freq, samples):
+        """Fill the scratch buffer with 2*pi*freq*t for the first `samples` samples."""
+        ramp, phase = self._buffers(samples)
+        np.multiply(ramp, 2 * np.pi * freq / self.sample_rate, out=phase)
+        return phase
+
+    def _to_int16(self, wave, amplitude):
+        """Scale a [-1, 1] float wave in place and cast it into a fresh int16 buffer."""
+        np.multiply(wave, amplitude * 32767, out=wave)
+        out = np.empty(wave.shape[0], dtype=np.int16)
+        np.copyto(out, wave, casting='unsafe')
+        return out
+
     def generate_sine_wave(self, freq, duration, amplitude=0.5):
         """Generate a sine wave for smooth sounds."""
         samples = int(self.sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        wave = amplitude * np.sin(2 * np.pi * freq * t)
-        return (wave * 32767).astype(np.int16)
+        wave = self._phase(freq, samples)
+        np.sin(wave, out=wave)
+        return self._to_int16(wave, amplitude)
 
     def generate_square_wave(self, freq, duration, amplitude=0.5):
         """Generate a square wave for retro NES-like sounds."""
         samples = int(self.sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        wave = amplitude * np.sign(np.sin(2 * np.pi * freq * t))
-        return (wave * 32767).astype(np.int16)
+        wave = self._phase(freq, samples)
+        np.sin(wave, out=wave)
+        np.sign(wave, out=wave)
+        return self._to_int16(wave, amplitude)
 
     def generate_descending_square_wave(self, start_freq, end_freq, duration, amplitude=0.5):
         """Generate a descending square wave for explosion sounds."""
         samples = int(self.sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        freqs = np.linspace(start_freq, end_freq, samples)
-        wave = amplitude * np.sign(np.sin(2 * np.pi * freqs * t))
-        return (wave * 32767).astype(np.int16)
+        ramp, wave = self._buffers(samples)
+        # Instantaneous frequency sweeps linearly from start_freq to end_freq
+        np.multiply(ramp, (end_freq - start_freq) / max(samples - 1, 1), out=wave)
+        np.add(wave, start_freq, out=wave)
+        np.multiply(wave, ramp, out=wave)
+        np.multiply(wave, 2 * np.pi / self.sample_rate, out=wave)
+        np.sin(wave, out=wave)
+        np.sign(wave, out=wave)
+        return self._to_int16(wave, amplitude)
 
     def generate_sounds(self):
-        """Generate all sound effects."""
-        # Player shoot: High-pitched sine wave
-        player_shoot_wave = self.generate_sine_wave(freq=880, duration=0.1)
-        self.sounds['player_shoot'] = pygame.mixer.Sound(player_shoot_wave)
-
-        # Enemy shoot: Lower-pitched square wave
-        enemy_shoot_wave = self.generate_square_wave(freq=440, duration=0.15)
-        self.sounds['enemy_shoot'] = pygame.mixer.Sound(enemy_shoot_wave)
-
-        # Enemy destroyed: Descending square wave
-        enemy_destroyed_wave = self.generate_descending_square_wave(start_freq=880, end_freq=440, duration=0.2)
-        self.sounds['enemy_destroyed'] = pygame.mixer.Sound(enemy_destroyed_wave)
-
-        # Player hit: Low-frequency square wave
-        player_hit_wave = self.generate_square_wave(freq=220, duration=0.3)
-        self.sounds['player_hit'] = pygame.mixer.Sound(player_hit_wave)
+        """Register the sound effects; each one is synthesized on first play."""
+        Sound = pygame.mixer.Sound
+        self._makers = {
+            # Player shoot: High-pitched sine wave
+            'player_shoot': lambda: Sound(self.generate_sine_wave(freq=880, duration=0.1)),
+            # Enemy shoot: Lower-pitched square wave
+            'enemy_shoot': lambda: Sound(self.generate_square_wave(freq=440, duration=0.15)),
+            # Enemy destroyed: Descending square wave
+            'enemy_destroyed': lambda: Sound(self.generate_descending_square_wave(start_freq=880, end_freq=440, duration=0.2)),
+            # Player hit: Low-frequency square wave
+            'player_hit': lambda: Sound(self.generate_square_wave(freq=220, duration=0.3)),
+        }
 
     def play(self, sound_name):
-        """Play a sound by name."""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        """Play a sound by name, generating it first if it hasn't been built yet."""
+        if sound_name not in self.sounds:
+            if sound_name not in self._makers:
+                return
+            # Well under 1 ms for a NumPy sound; Sound copies the samples, so the wave is freed
+            self.sounds[sound_name] = self._makers[sound_name]()
+        self.sounds[sound_name].play()
 
 # --- Classes ---
 
-class Player(pygame.sprite.Sprite):
+class Player(pygame.sprite.DirtySprite):
+    # Sprite itself has no __slots__, so image/rect still live in __dict__
+    __slots__ = ('speed_x', 'lives', 'shoot_delay', 'shoot_cooldown')
+
     def __init__(self):
         super().__init__()
         self.image = pygame.Surface([PLAYER_WIDTH, PLAYER_HEIGHT])
@@ -108,69 +147,78 @@ class Player(pygame.sprite.Sprite):
         self.rect.y = SCREEN_HEIGHT - PLAYER_HEIGHT - 20
         self.speed_x = 0
         self.lives = PLAYER_LIVES
-        self.shoot_delay = 250  # milliseconds
-        self.last_shot_time = pygame.time.get_ticks()
+        self.shoot_delay = 0.25  # seconds
+        self.shoot_cooldown = self.shoot_delay
 
-    def update(self):
-        self.speed_x = 0
-        keystate = pygame.key.get_pressed()
-        if keystate[pygame.K_LEFT] or keystate[pygame.K_a]:
-            self.speed_x = -PLAYER_SPEED
-        if keystate[pygame.K_RIGHT] or keystate[pygame.K_d]:
-            self.speed_x = PLAYER_SPEED
-        
-        self.rect.x += self.speed_x
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
+    def update(self, dt):
+        self.shoot_cooldown -= dt
+        keys = keystate()
+        right = keys[K_RIGHT] or keys[K_d]
+        left = keys[K_LEFT] or keys[K_a]
+        self.speed_x = PLAYER_SPEED * (int(right) - int(left))
+
+        if self.speed_x:
+            self.dirty = 1
+        self.rect.x = max(0, min(self.rect.x + self.speed_x, SCREEN_WIDTH - PLAYER_WIDTH))
 
     def shoot(self, all_sprites, player_bullets, sound_engine):
-        now = pygame.time.get_ticks()
-        if now - self.last_shot_time > self.shoot_delay:
-            self.last_shot_time = now
-            bullet = Bullet(self.rect.centerx, self.rect.top, -1, YELLOW)  # -1 for up
+        if self.shoot_cooldown <= 0:
+            self.shoot_cooldown = self.shoot_delay
+            bullet = Bullet.spawn(self.rect.centerx, self.rect.top, -1, YELLOW)  # -1 for up
             all_sprites.add(bullet)
             player_bullets.add(bullet)
             sound_engine.play('player_shoot')
 
-class Enemy(pygame.sprite.Sprite):
+def _make_enemy_surface(enemy_type):
+    """Draw the alien shape for one enemy type onto a new surface."""
+    image = pygame.Surface([ENEMY_WIDTH, ENEMY_HEIGHT])
+    image.set_colorkey(BLACK)  # Important for drawing complex shapes
+
+    # Draw some simple alien shapes
+    if enemy_type == 0:
+        color = (200, 50, 50)  # Reddish
+        pygame.draw.rect(image, color, (0, 0, ENEMY_WIDTH, ENEMY_HEIGHT))
+        pygame.draw.rect(image, WHITE, (ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Eye 1
+        pygame.draw.rect(image, WHITE, (ENEMY_WIDTH*0.6, ENEMY_HEIGHT*0.2, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Eye 2
+    elif enemy_type == 1:
+        color = (50, 200, 50)  # Greenish
+        pygame.draw.ellipse(image, color, (0, 0, ENEMY_WIDTH, ENEMY_HEIGHT))
+        pygame.draw.rect(image, BLACK, (ENEMY_WIDTH*0.4, ENEMY_HEIGHT*0.4, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Mouth
+    else:
+        color = (50, 50, 200)  # Bluish
+        points = [(0, ENEMY_HEIGHT), (ENEMY_WIDTH//2, 0), (ENEMY_WIDTH, ENEMY_HEIGHT), (ENEMY_WIDTH*0.75, ENEMY_HEIGHT*0.75), (ENEMY_WIDTH*0.25, ENEMY_HEIGHT*0.75)]
+        pygame.draw.polygon(image, color, points)
+    return image
+
+# Enemies never modify their image, so every instance shares one of these
+_ENEMY_SURFACES = [_make_enemy_surface(i) for i in range(3)]
+
+class Enemy(pygame.sprite.DirtySprite):
+    __slots__ = ()
+
     def __init__(self, x, y, enemy_type=0):
         super().__init__()
-        self.image = pygame.Surface([ENEMY_WIDTH, ENEMY_HEIGHT])
-        self.image.set_colorkey(BLACK)  # Important for drawing complex shapes
-        
-        # Draw some simple alien shapes
-        if enemy_type % 3 == 0:
-            color = (200, 50, 50)  # Reddish
-            pygame.draw.rect(self.image, color, (0, 0, ENEMY_WIDTH, ENEMY_HEIGHT))
-            pygame.draw.rect(self.image, WHITE, (ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Eye 1
-            pygame.draw.rect(self.image, WHITE, (ENEMY_WIDTH*0.6, ENEMY_HEIGHT*0.2, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Eye 2
-        elif enemy_type % 3 == 1:
-            color = (50, 200, 50)  # Greenish
-            pygame.draw.ellipse(self.image, color, (0, 0, ENEMY_WIDTH, ENEMY_HEIGHT))
-            pygame.draw.rect(self.image, BLACK, (ENEMY_WIDTH*0.4, ENEMY_HEIGHT*0.4, ENEMY_WIDTH*0.2, ENEMY_HEIGHT*0.2))  # Mouth
-        else:
-            color = (50, 50, 200)  # Bluish
-            points = [(0, ENEMY_HEIGHT), (ENEMY_WIDTH//2, 0), (ENEMY_WIDTH, ENEMY_HEIGHT), (ENEMY_WIDTH*0.75, ENEMY_HEIGHT*0.75), (ENEMY_WIDTH*0.25, ENEMY_HEIGHT*0.75)]
-            pygame.draw.polygon(self.image, color, points)
-
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.image = _ENEMY_SURFACES[enemy_type % 3]
+        self.rect = self.image.get_rect(topleft=(x, y))
 
     def shoot(self, all_sprites, enemy_bullets_group, sound_engine):
-        bullet = Bullet(self.rect.centerx, self.rect.bottom, 1, CYAN)  # 1 for down
+        bullet = Bullet.spawn(self.rect.centerx, self.rect.bottom, 1, CYAN)  # 1 for down
         all_sprites.add(bullet)
         enemy_bullets_group.add(bullet)
         sound_engine.play('enemy_shoot')
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(pygame.sprite.DirtySprite):
+    __slots__ = ('speed_y',)
+    _pool = []  # Killed bullets waiting to be reused by spawn()
+
     def __init__(self, x, y, direction, color):
         super().__init__()
         self.image = pygame.Surface([BULLET_WIDTH, BULLET_HEIGHT])
-        self.image.fill(color)
         self.rect = self.image.get_rect()
+        self._reset(x, y, direction, color)
+
+    def _reset(self, x, y, direction, color):
+        self.image.fill(color)
         self.rect.centerx = x
         self.rect.centery = y
         if direction == -1:  # Player bullet starts from top
@@ -179,11 +227,138 @@ class Bullet(pygame.sprite.Sprite):
             self.rect.top = y
 
         self.speed_y = BULLET_SPEED * direction
-
-    def update(self):
-        self.rect.y += self.speed_y
-        if self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
-            self.kill()
+        self.dirty = 1
+
+    @classmethod
+    def spawn(cls, x, y, direction, color):
+        """Return a bullet from the pool, or a new one if the pool is empty."""
+        if cls._pool:
+            bullet = cls._pool.pop()
+            bullet._reset(x, y, direction, color)
+            return bullet
+        return cls(x, y, direction, color)
+
+    @classmethod
+    def fill_pool(cls, count):
+        """Pre-allocate bullets so early shots don't create surfaces."""
+        while len(cls._pool) < count:
+            cls._pool.append(cls(0, 0, 1, CYAN))
+
+    def kill(self):
+        if self.alive():  # Don't pool the same bullet twice
+            self._pool.append(self)
+        super().kill()
+
+class BulletGroup(pygame.sprite.Group):
+    """Bullet group that moves all of its bullets in one vectorized update.
+
+    Positions and velocities live in preallocated NumPy arrays whose first
+    `_n` slots are live and ordered like `_sprites`. Removal swaps the last
+    live bullet into the freed slot, so add and remove are O(1).
+    """
+    _INITIAL_CAPACITY = 32
+
+    def __init__(self, *sprites):
+        self._xs = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._ys = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._vs = np.empty(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._n = 0
+        self._sprites = []
+        self._index = {}  # sprite -> array slot
+        super().__init__(*sprites)
+
+    def _grow(self):
+        size = self._xs.shape[0] * 2
+        self._xs = np.resize(self._xs, size)
+        self._ys = np.resize(self._ys, size)
+        self._vs = np.resize(self._vs, size)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        i = self._n
+        if i == self._xs.shape[0]:
+            self._grow()
+        self._xs[i] = sprite.rect.x
+        self._ys[i] = sprite.rect.y
+        self._vs[i] = sprite.speed_y
+        self._sprites.append(sprite)
+        self._index[sprite] = i
+        self._n = i + 1
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        i = self._index.pop(sprite)
+        last = self._n - 1
+        moved = self._sprites.pop()
+        if i != last:
+            # Swap-remove: the last live bullet takes over the freed slot
+            self._xs[i] = self._xs[last]
+            self._ys[i] = self._ys[last]
+            self._vs[i] = self._vs[last]
+            self._sprites[i] = moved
+            self._index[moved] = i
+        self._n = last
+
+    def update(self, *args, **kwargs):
+        n = self._n
+        if not n:
+            return
+        ys = self._ys[:n]
+        ys += self._vs[:n]
+        dead = []
+        for bullet, y in zip(self._sprites, ys.tolist()):
+            bullet.rect.y = y
+            bullet.dirty = 1
+            if y + BULLET_HEIGHT < 0 or y > SCREEN_HEIGHT:
+                dead.append(bullet)
+
+        # Kill bullets that left the screen; kill() swap-removes them from the arrays
+        for bullet in dead:
+            bullet.kill()
+
+    def collide_enemies(self, enemies_group):
+        """Return (enemy, bullet) pairs from one broadcast AABB test against an EnemyGroup."""
+        if not self._sprites or not enemies_group.ordered:
+            return []
+        ex = enemies_group.xs[:, None]
+        ey = enemies_group.ys[:, None]
+        xs = self._xs[:self._n]
+        ys = self._ys[:self._n]
+        hit = ((ex < xs + BULLET_WIDTH) & (xs < ex + ENEMY_WIDTH) &
+               (ey < ys + BULLET_HEIGHT) & (ys < ey + ENEMY_HEIGHT))
+        return [(enemies_group.ordered[e], self._sprites[b]) for e, b in np.argwhere(hit)]
+
+class EnemyGroup(pygame.sprite.Group):
+    """Enemy group that mirrors sprite positions in NumPy arrays (structure of arrays).
+
+    `xs`/`ys` hold each enemy's top-left corner in the same order as `ordered`,
+    so the formation can be stepped with a couple of vectorized ops.
+    """
+    def __init__(self, *sprites):
+        self.xs = np.empty(0, dtype=np.int32)
+        self.ys = np.empty(0, dtype=np.int32)
+        self.ordered = []
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.ordered.append(sprite)
+        self.xs = np.append(self.xs, np.int32(sprite.rect.x))
+        self.ys = np.append(self.ys, np.int32(sprite.rect.y))
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        i = self.ordered.index(sprite)
+        del self.ordered[i]
+        self.xs = np.delete(self.xs, i)
+        self.ys = np.delete(self.ys, i)
+
+    def sync_rects(self):
+        """Write the array positions back to the sprite rects."""
+        for enemy, x, y in zip(self.ordered, self.xs.tolist(), self.ys.tolist()):
+            enemy.rect.x = x
+            enemy.rect.y = y
+            enemy.dirty = 1
 
 # --- Game Functions ---
 
@@ -202,32 +377,47 @@ def create_enemies(all_sprites, enemies_group):
             enemies_group.add(enemy)
     return enemies_group
 
-def display_text(surface, text, size, x, y, color=WHITE):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+@lru_cache(maxsize=16)
+def _get_font(size):
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=64)
+def _render_text(text, size, color):
+    # HUD strings repeat every frame; only re-render when the text changes
+    return _get_font(size).render(text, True, color)
+
+def text_blit(text, size, x, y, color=WHITE):
+    """Return a (surface, rect) pair for text centered horizontally on x."""
+    text_surface = _render_text(text, size, color)
     text_rect = text_surface.get_rect()
     text_rect.midtop = (x, y)
+    return text_surface, text_rect
+
+def display_text(surface, text, size, x, y, color=WHITE):
+    text_surface, text_rect = text_blit(text, size, x, y, color)
     surface.blit(text_surface, text_rect)
 
+def wait_for_restart():
+    """Block until R is released (restart); quit on Q or window close."""
+    while True:
+        event = pygame.event.wait()  # Sleeps in the OS event loop, no polling
+        if event.type == QUIT:
+            pygame.quit()
+            sys.exit()
+        if event.type == KEYUP:
+            if event.key == K_q:
+                pygame.quit()
+                sys.exit()
+            if event.key == K_r:
+                return
+
 def game_over_screen(screen, score):
     screen.fill(BLACK)
     display_text(screen, "GAME OVER!", 64, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4, RED)
     display_text(screen, f"Final Score: {score}", 40, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     display_text(screen, "Press R to Restart or Q to Quit", 30, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3 // 4)
     pygame.display.flip()
-    waiting_for_input = True
-    while waiting_for_input:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_q:
-                    pygame.quit()
-                    sys.exit()
-                if event.key == pygame.K_r:
-                    waiting_for_input = False
-        pygame.time.Clock().tick(15)
+    wait_for_restart()
 
 def win_screen(screen, score):
     screen.fill(BLACK)
@@ -235,19 +425,7 @@ def win_screen(screen, score):
     display_text(screen, f"Final Score: {score}", 40, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     display_text(screen, "Press R to Play Again or Q to Quit", 30, SCREEN_WIDTH // 2, SCREEN_HEIGHT * 3 // 4)
     pygame.display.flip()
-    waiting_for_input = True
-    while waiting_for_input:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_q:
-                    pygame.quit()
-                    sys.exit()
-                if event.key == pygame.K_r:
-                    waiting_for_input = False
-        pygame.time.Clock().tick(15)
+    wait_for_restart()
 
 # --- Main Game Loop ---
 def main_game():
@@ -261,10 +439,12 @@ def main_game():
     sound_engine = SoundEngine()
 
     # Sprite Groups
-    all_sprites = pygame.sprite.Group()
-    enemies_group = pygame.sprite.Group()
-    player_bullets = pygame.sprite.Group()
-    enemy_bullets = pygame.sprite.Group()
+    all_sprites = pygame.sprite.LayeredDirty()  # Only repaints sprites flagged dirty
+    enemies_group = EnemyGroup()
+    player_bullets = BulletGroup()
+    enemy_bullets = BulletGroup()
+
+    Bullet.fill_pool(BULLET_POOL_SIZE)
 
     player = Player()
     all_sprites.add(player)
@@ -272,28 +452,41 @@ def main_game():
     create_enemies(all_sprites, enemies_group)
     
     score = 0
+    rng = np.random.default_rng()
     enemy_current_move_speed_x = ENEMY_MOVE_SPEED_X
     move_enemies_down = False
-    last_enemy_move_time = pygame.time.get_ticks()
+    enemy_move_acc = 0.0  # Seconds since the last enemy step
+
+    # Paint the background once; afterwards only changed areas are repainted
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill(BLACK)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+    all_sprites.clear(screen, background)
+    # pygame-ce's fblits skips building a result list; plain pygame only has blits
+    blit_batch = getattr(screen, 'fblits', screen.blits)
+    hud_state = None
+    hud_blits = []
 
     running = True
     game_state = "playing"
 
+    clock.tick()  # Don't count setup time in the first frame's dt
     while running:
         dt = clock.tick(FPS) / 1000.0
 
         # --- Event Handling ---
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 running = False
-            if event.type == pygame.KEYDOWN:
+            if event.type == KEYDOWN:
                 if game_state == "playing":
-                    if event.key == pygame.K_SPACE or event.key == pygame.K_UP or event.key == pygame.K_w:
+                    if event.key == K_SPACE or event.key == K_UP or event.key == K_w:
                         player.shoot(all_sprites, player_bullets, sound_engine)
                 elif game_state == "game_over" or game_state == "win":
-                    if event.key == pygame.K_r:
+                    if event.key == K_r:
                         return True
-                    if event.key == pygame.K_q:
+                    if event.key == K_q:
                         running = False
             
         if game_state != "playing":
@@ -306,42 +499,48 @@ def main_game():
             continue
 
         # --- Updates ---
-        all_sprites.update()
+        all_sprites.update(dt)
+        player_bullets.update()
+        enemy_bullets.update()
 
         # Enemy movement logic (NES-style stepping)
         if enemies_group:
-            now = pygame.time.get_ticks()
-            if now - last_enemy_move_time >= ENEMY_MOVE_INTERVAL:
-                wall_hit = False
-                for enemy in enemies_group:
-                    enemy.rect.x += enemy_current_move_speed_x
-                    if enemy.rect.right > SCREEN_WIDTH or enemy.rect.left < 0:
-                        wall_hit = True
-                
-                if wall_hit:
+            # Clamped so a long frame (window drag, stall) yields one step, not a burst
+            enemy_move_acc = min(enemy_move_acc + dt, ENEMY_MOVE_INTERVAL / 1000)
+            if enemy_move_acc >= ENEMY_MOVE_INTERVAL / 1000:
+                enemy_move_acc = 0.0
+                xs = enemies_group.xs
+                ys = enemies_group.ys
+                xs += enemy_current_move_speed_x
+                if xs.max() + ENEMY_WIDTH > SCREEN_WIDTH or xs.min() < 0:
                     enemy_current_move_speed_x *= -1
                     move_enemies_down = True
                 
                 if move_enemies_down:
-                    for enemy in enemies_group:
-                        enemy.rect.y += ENEMY_MOVE_DOWN_STEP
-                        if enemy.rect.bottom >= player.rect.top:
-                            player.lives = 0
-                            game_state = "game_over"
-                            print("Enemies reached the player! GAME OVER!")
+                    ys += ENEMY_MOVE_DOWN_STEP
+                    if ys.max() + ENEMY_HEIGHT >= player.rect.top:
+                        player.lives = 0
+                        game_state = "game_over"
+                        print("Enemies reached the player! GAME OVER!")
                     move_enemies_down = False
                 
-                last_enemy_move_time = now
+                enemies_group.sync_rects()
 
-        # Enemy shooting
-        for enemy in enemies_group:
-            if random.random() < ENEMY_SHOOT_CHANCE:
-                enemy.shoot(all_sprites, enemy_bullets, sound_engine)
+        # Enemy shooting: one Bernoulli draw per enemy, vectorized. Reads the
+        # group's own ordered list, which shoot() doesn't modify, so no copy is needed
+        shooters = enemies_group.ordered
+        shoot_mask = rng.random(len(shooters)) < ENEMY_SHOOT_CHANCE
+        for i in np.flatnonzero(shoot_mask):
+            shooters[i].shoot(all_sprites, enemy_bullets, sound_engine)
 
         # --- Collision Detection ---
         # Player bullets hit enemies
-        hits = pygame.sprite.groupcollide(enemies_group, player_bullets, True, True)
-        for hit_enemy in hits:
+        for hit_enemy, hit_bullet in player_bullets.collide_enemies(enemies_group):
+            # Each bullet destroys at most one enemy, and each enemy dies once
+            if not hit_bullet.alive() or not hit_enemy.alive():
+                continue
+            hit_bullet.kill()
+            hit_enemy.kill()
             score += 100
             print(f"Enemy destroyed! Score: {score}")
             sound_engine.play('enemy_destroyed')
@@ -363,14 +562,20 @@ def main_game():
             print("All enemies destroyed! YOU WIN!")
 
         # --- Drawing ---
-        screen.fill(BLACK)
-        all_sprites.draw(screen)
-
-        # Display score and lives
-        display_text(screen, f"Score: {score}", 30, SCREEN_WIDTH - 100, 10)
-        display_text(screen, f"Lives: {player.lives}", 30, 100, 10)
-
-        pygame.display.flip()
+        for _, rect in hud_blits:
+            all_sprites.repaint_rect(rect)
+        dirty_rects = all_sprites.draw(screen)
+
+        # Display score and lives, rebuilding the HUD only when they change
+        if hud_state != (score, player.lives):
+            hud_state = (score, player.lives)
+            hud_blits = [
+                text_blit(f"Score: {score}", 30, SCREEN_WIDTH - 100, 10),
+                text_blit(f"Lives: {player.lives}", 30, 100, 10),
+            ]
+        blit_batch(hud_blits)
+
+        pygame.display.update(dirty_rects + [rect for _, rect in hud_blits])
 
     pygame.quit()
     sys.exit()